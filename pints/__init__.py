@@ -9,6 +9,7 @@ It allows initializing, seeding, and extending DuckDB databases that
 conform to the PINTS standard.
 """
 
+from functools import lru_cache
 from importlib.resources import files
 
 __all__ = ["__version__", "get_sql_path"]
@@ -16,7 +17,11 @@ __all__ = ["__version__", "get_sql_path"]
 # Current package version (keep in sync with pyproject.toml)
 __version__ = "0.1.0"
 
+# Resolved once; get_sql_path() only joins onto it
+_SQL_ROOT = files("pints") / "sql"
 
+
+@lru_cache(maxsize=None)
 def get_sql_path(filename: str) -> str:
     """
     Return the path to a bundled SQL file from the core schema.
@@ -31,4 +36,4 @@ def get_sql_path(filename: str) -> str:
     str
         Path to the SQL file inside the installed package.
     """
-    return str(files("pints.sql").joinpath(filename))
+    return str(_SQL_ROOT.joinpath(filename))
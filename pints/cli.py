@@ -7,12 +7,15 @@ Command-line utilities for managing a PINTS DuckDB database.
 Examples
     pints init --db pints.duckdb
     pints seed --db pints.duckdb
+    pints init --db pints.duckdb --seed
     pints add-sample --db pints.duckdb --id S001 --type Sample --desc "River water"
     pints add-run    --db pints.duckdb --id R001 --sample S001 --time "2025-09-12 09:00:00" --instrument QTOF-XYZ --method POS_5min --batch B01
     pints add-feature --db pints.duckdb --id R001_F0001 --run R001 --mz 301.123456 --rt 312.4 --area 154321.2
     pints show-version --db pints.duckdb
     pints list-tables --db pints.duckdb
+    pints import features --db pints.duckdb --csv features.csv
     pints export features --db pints.duckdb --out features.csv
+    pints export features --db pints.duckdb --out features.parquet --format parquet
     pints migrate --db pints.duckdb --file path/to/plugin.sql
     pints run-sql --db pints.duckdb --query "SELECT COUNT(*) FROM features"
     pints export-sql --db pints.duckdb --query "SELECT * FROM features" --out features.csv
@@ -23,17 +26,30 @@ Examples
     pints plugin install --db my.duckdb --name intra_run_components
     pints plugin staging-create --db my.duckdb --name intra_run_components
     pints plugin load-csv --db my.duckdb --name intra_run_components --csv assignments.csv
+    pints plugin load-csv --db my.duckdb --name intra_run_components --csv part1.csv part2.csv
     pints plugin insert --db my.duckdb --name intra_run_components --rows "R001,R001_F0001,C001" "R001,R001_F0002,C001" --materialize
+    pints plugin insert --db my.duckdb --name intra_run_components --rows-file assignments_rows.csv --materialize
     pints plugin action --db my.duckdb --name intra_run_components --action materialize
     pints plugin export --db my.duckdb --name intra_run_components --out intra.csv
 """
 
 import argparse
+import atexit
+import csv
 import os
+import sys
+from itertools import islice
 from pathlib import Path
-import duckdb
+from typing import TYPE_CHECKING, Optional
 
-from .db import PintsDB
+if TYPE_CHECKING:  # the DB layer (and duckdb) is imported lazily in _open_db()
+    from .db import PintsDB
+
+# --rows are inserted in chunks of _INSERT_CHUNK; a chunk of at most
+# _EXECUTEMANY_MAX rows goes through one prepared INSERT via executemany,
+# bigger chunks are staged through a registered DataFrame instead.
+_INSERT_CHUNK = 10_000
+_EXECUTEMANY_MAX = 256
 
 
 def _default_db_arg(parser: argparse.ArgumentParser):
@@ -41,43 +57,106 @@ def _default_db_arg(parser: argparse.ArgumentParser):
     parser.add_argument("--db", default=default_db, help="Path to DuckDB file (default: %(default)s or $PINTS_DB)")
 
 
+def _open_db(path: str) -> "PintsDB":
+    """Open a PintsDB whose cached connection is closed when the process exits."""
+    from .db import PintsDB
+
+    db = PintsDB(path)
+    atexit.register(db.close)
+    return db
+
+
+_INT_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "INT", "BIGINT", "HUGEINT"}
+_FLOAT_TYPES = {"DOUBLE", "FLOAT", "REAL"}
+
+
+def _lenient(conv):
+    """Wrap a converter so fields it rejects (e.g. '1.0' for int) stay strings for DuckDB to cast."""
+    def convert(v: str):
+        try:
+            return conv(v)
+        except ValueError:
+            return v
+    return convert
+
+
+def _coerce_fn(sql_type: str):
+    """Map a manifest column type to the Python converter applied to --rows fields."""
+    base = sql_type.split("(")[0].split()[0].upper() if sql_type else ""
+    if base in _INT_TYPES:
+        return _lenient(int)
+    if base in _FLOAT_TYPES:
+        return _lenient(float)
+    return str
+
+
+def _iter_rows(rows, delimiter: str, coercers: list, col_names: list[str]):
+    """Yield --rows entries split on delimiter and converted to the staging column types."""
+    ncols = len(col_names)
+    for row_str in rows:
+        # each argv entry is one row: tokenize it on its own so an unbalanced quote
+        # can't run into the next entry. csv.reader (C tokenizer, honours quoted
+        # fields) only takes 1-char delimiters; strict=True rejects bad quoting.
+        if len(delimiter) == 1:
+            try:
+                fields = next(csv.reader([row_str], delimiter=delimiter, strict=True), [])
+            except csv.Error as e:
+                raise SystemExit(f"Cannot parse row ({e}). Row: {row_str}")
+        else:
+            fields = row_str.split(delimiter)
+        parts = [p.strip() for p in fields]
+        if len(parts) != ncols:
+            raise SystemExit(
+                f"Row has {len(parts)} fields but staging expects {ncols} ({col_names}). "
+                f"Row: {row_str}"
+            )
+        yield [conv(v) for conv, v in zip(coercers, parts)]
+
+
 def _parse_params(kvs: list[str]) -> dict:
+    import ast
+
     out = {}
     for kv in kvs or []:
-        if "=" not in kv:
+        k, sep, v = kv.partition("=")
+        if not sep:
             raise SystemExit(f"--param expects key=value, got: {kv}")
-        k, v = kv.split("=", 1)
-        # naive coercion: try float, else keep string
+        # Scalar Python literals (ints, floats incl. 1e5/-3, bools, None, quoted strings);
+        # anything else (1,2 is a tuple, [..] a list) can't be bound, so keep the string
         try:
-            v = float(v) if "." in v or v.isdigit() else v
-        except Exception:
-            pass
-        out[k] = v
+            lit = ast.literal_eval(v)
+        except (ValueError, SyntaxError, TypeError, RecursionError, MemoryError):
+            lit = v
+        out[k] = lit if lit is None or isinstance(lit, (int, float, str)) else v
     return out
 
 
 # ---------------- command handlers ----------------
 
 def cmd_init(args):
-    db = PintsDB(args.db)
-    db.init_schema()
-    print(f"✅ Schema initialized in {args.db}")
+    db = _open_db(args.db)
+    if args.seed:
+        db.bootstrap()
+        print(f"✅ Schema initialized and seeded in {args.db}")
+    else:
+        db.init_schema()
+        print(f"✅ Schema initialized in {args.db}")
 
 
 def cmd_seed(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.seed_minimal_vocab()
     print(f"✅ Seeded minimal PSI-MS dictionary in {args.db}")
 
 
 def cmd_add_sample(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.add_sample(args.id, sample_type=args.type, description=args.desc)
     print(f"✅ Sample '{args.id}' upserted")
 
 
 def cmd_add_run(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.add_run(
         args.id,
         sample_id=args.sample,
@@ -90,46 +169,53 @@ def cmd_add_run(args):
 
 
 def cmd_add_feature(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.add_feature(args.id, run_id=args.run, sample_id=args.sample, mz=args.mz, rt=args.rt, area=args.area)
     print(f"✅ Feature '{args.id}' upserted")
 
 
 def cmd_show_version(args):
-    con = duckdb.connect(args.db)
-    try:
-        schema_row = con.execute(
-            "SELECT schema_version FROM schema_info WHERE schema_name='pints_schema'"
-        ).fetchone()
-        vocab_row = con.execute(
-            "SELECT vocab_version FROM vocabulary_info WHERE vocab_name='pints_dictionary'"
-        ).fetchone()
-    finally:
-        con.close()
-    print("Schema version:", schema_row[0] if schema_row else "(not initialized)")
-    print("Vocab  version:", vocab_row[0] if vocab_row else "(not seeded)")
+    schema_version, vocab_version = _open_db(args.db).connection.execute(
+        "SELECT"
+        " (SELECT schema_version FROM schema_info WHERE schema_name='pints_schema'),"
+        " (SELECT vocab_version FROM vocabulary_info WHERE vocab_name='pints_dictionary')"
+    ).fetchone()
+    print("Schema version:", schema_version or "(not initialized)")
+    print("Vocab  version:", vocab_version or "(not seeded)")
 
 
 def cmd_list_tables(args):
-    con = duckdb.connect(args.db)
-    try:
-        df = con.execute("SHOW TABLES").fetchdf()
-    finally:
-        con.close()
-    print(df)
+    rows = _open_db(args.db).connection.execute("SHOW TABLES").fetchall()
+    for (name,) in rows:
+        print(name)
 
 
 def cmd_export(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
+    if args.format == "parquet":
+        db.export_parquet(args.table, args.out)
+        print(f"✅ Exported '{args.table}' to {args.out} (parquet)")
+        return
     db.export_table(args.table, args.out, header=not args.no_header)
     print(f"✅ Exported '{args.table}' to {args.out} (header={'no' if args.no_header else 'yes'})")
 
 
+def cmd_import(args):
+    db = _open_db(args.db)
+    importer = {
+        "samples": db.import_samples_csv,
+        "runs": db.import_runs_csv,
+        "features": db.import_features_csv,
+    }[args.table]
+    n = importer(args.csv)
+    print(f"✅ Imported {n} row(s) into '{args.table}' from {args.csv}")
+
+
 def cmd_migrate(args):
     sql_path = Path(args.file)
     if not sql_path.exists():
         raise SystemExit(f"❌ File not found: {sql_path}")
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.migrate(sql_path)
     print(f"✅ Applied SQL: {sql_path}")
 
@@ -140,7 +226,7 @@ def cmd_run_sql(args):
         sql = Path(args.query).read_text(encoding="utf-8")
     else:
         sql = args.query
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     df = db.run_sql(sql)
     if df is None:
         print("✅ Statement executed (no result set).")
@@ -154,13 +240,17 @@ def cmd_export_sql(args):
         sql = Path(args.query).read_text(encoding="utf-8")
     else:
         sql = args.query
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
+    if args.format == "parquet":
+        db.export_sql_parquet(sql, args.out)
+        print(f"✅ Exported query to {args.out} (parquet)")
+        return
     db.export_sql(sql, args.out, header=not args.no_header)
     print(f"✅ Exported query to {args.out} (header={'no' if args.no_header else 'yes'})")
 
 
 def cmd_set_prop(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     db.set_algo_property(
         args.level, args.id, args.key,
         value=args.value, value_text=args.value_text,
@@ -170,7 +260,7 @@ def cmd_set_prop(args):
 
 
 def cmd_get_props(args):
-    db = PintsDB(args.db)
+    db = _open_db(args.db)
     df = db.get_algo_properties(args.level, args.id)
     if df is None or df.empty:
         print("(no properties or table not present)")
@@ -181,44 +271,44 @@ def cmd_get_props(args):
 # ---------------- plugin command handlers (manifest-driven) ----------------
 
 def cmd_plugin_install(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     db.plugin_install(a.name, root=a.root)
     print(f"✅ Installed plugin '{a.name}'")
 
 
 def cmd_plugin_staging_create(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     db.plugin_staging_create(a.name, root=a.root)
     print(f"✅ Staging created for '{a.name}'")
 
 
 def cmd_plugin_staging_clear(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     db.plugin_staging_clear(a.name, root=a.root)
     print(f"✅ Staging cleared for '{a.name}'")
 
 
 def cmd_plugin_load_csv(a):
-    db = PintsDB(a.db)
-    db.plugin_staging_load_csv(a.name, a.csv, root=a.root)
-    print(f"✅ CSV loaded into staging for '{a.name}': {a.csv}")
+    db = _open_db(a.db)
+    n = db.plugin_staging_load_csvs(a.name, a.csv, root=a.root)
+    print(f"✅ CSV loaded into staging for '{a.name}' ({n} row(s)): {', '.join(a.csv)}")
 
 
 def cmd_plugin_action(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     params = _parse_params(a.param)
     df = db.plugin_action_run(a.name, a.action, params=params, root=a.root)
     print("(no result set)" if df is None else df)
 
 
 def cmd_plugin_export(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     db.plugin_export(a.name, a.out, action=a.action, root=a.root, header=not a.no_header)
     print(f"✅ Exported '{a.name}:{a.action}' -> {a.out}")
 
 
 def cmd_plugin_apply(a):
-    db = PintsDB(a.db)
+    db = _open_db(a.db)
     db.plugin_install(a.name, root=a.root)         # idempotent
     db.plugin_staging_create(a.name, root=a.root)  # idempotent
     db.plugin_staging_load_csv(a.name, a.csv, root=a.root)
@@ -234,8 +324,12 @@ def cmd_plugin_insert(a):
     Example:
       pints plugin insert --db my.duckdb --name intra_run_components \\
         --rows "R001,R001_F0001,C001" "R001,R001_F0002,C001" --materialize
+      pints plugin insert --db my.duckdb --name intra_run_components \\
+        --rows-file assignments_rows.csv
     """
-    db = PintsDB(a.db)
+    from .db import _quote_ident
+
+    db = _open_db(a.db)
     # Read manifest to get staging table & columns
     manifest = db.plugin_manifest(a.name, root=a.root)
     st = (manifest.get("staging") or {})
@@ -250,25 +344,62 @@ def cmd_plugin_insert(a):
     # Ensure staging exists
     db.plugin_staging_create(a.name, root=a.root)
 
-    # Prepare parameterized INSERT
-    placeholders = ", ".join(["?"] * ncols)
-    collist = ", ".join(col_names)
-    sql = f"INSERT INTO {table} ({collist}) VALUES ({placeholders})"
-
-    # Insert rows
-    con = duckdb.connect(a.db)
-    try:
+    # manifest-supplied names are quoted as identifiers, as in PintsDB's staging methods
+    qtable = _quote_ident(table)
+    qcols = [_quote_ident(n) for n in col_names]
+    collist = ", ".join(qcols)
+    if a.rows_file:
+        # Let DuckDB's CSV reader parse the file straight into staging (no Python loop).
+        # Fields are read as text and trimmed like --rows fields, then cast by the INSERT.
+        import duckdb
+
+        rows_path = Path(a.rows_file)
+        if not rows_path.exists():
+            raise SystemExit(f"❌ File not found: {rows_path}")
+        columns = ", ".join("'" + n.replace("'", "''") + "': 'VARCHAR'" for n in col_names)
+        trimmed = ", ".join(f"trim({q})" for q in qcols)
+        try:
+            with db.transaction() as con:
+                total = con.execute(
+                    f"INSERT INTO {qtable} ({collist}) SELECT {trimmed} "
+                    f"FROM read_csv(?, header = false, delim = ?, columns = {{{columns}}})",
+                    [str(rows_path), a.delimiter],
+                ).fetchone()[0]
+        except duckdb.Error as e:
+            raise SystemExit(f"❌ Cannot load {rows_path}: {str(e).splitlines()[0]}")
+    else:
+        coercers = [_coerce_fn(c.get("type", "")) for c in cols]
+        records = _iter_rows(a.rows, a.delimiter, coercers, col_names)
+
+        # Stream rows in chunks of _INSERT_CHUNK: small chunks bind each row against
+        # a single prepared INSERT, larger ones are registered as a DataFrame and
+        # ingested with INSERT ... SELECT. One transaction covers all chunks, so a
+        # malformed row anywhere leaves staging untouched.
+        # Fields the coercers leave as text are cast by DuckDB; a value it cannot
+        # cast is reported like any other bad row instead of escaping as a traceback.
+        import duckdb
+
+        placeholders = ", ".join(["?"] * ncols)
         total = 0
-        for row_str in a.rows:
-            parts = [p.strip() for p in row_str.split(a.delimiter)]
-            if len(parts) != ncols:
-                raise SystemExit(
-                    f"Row has {len(parts)} fields but staging expects {ncols} ({col_names}). Row: {row_str}"
-                )
-            con.execute(sql, parts)
-            total += 1
-    finally:
-        con.close()
+        try:
+            with db.transaction() as con:
+                while True:
+                    chunk = list(islice(records, _INSERT_CHUNK))
+                    if not chunk:
+                        break
+                    if len(chunk) <= _EXECUTEMANY_MAX:
+                        con.executemany(f"INSERT INTO {qtable} ({collist}) VALUES ({placeholders})", chunk)
+                    else:
+                        import pandas as pd
+                        con.register("staging_batch", pd.DataFrame.from_records(chunk, columns=col_names))
+                        try:
+                            con.execute(f"INSERT INTO {qtable} ({collist}) SELECT {collist} FROM staging_batch")
+                        finally:
+                            con.unregister("staging_batch")
+                    total += len(chunk)
+                    del chunk
+        except duckdb.ConversionException as e:
+            raise SystemExit(f"Cannot convert row to staging column types ({str(e).splitlines()[0]}).")
 
     print(f"✅ Inserted {total} row(s) into staging '{table}' for plugin '{a.name}'")
 
@@ -278,29 +409,31 @@ def cmd_plugin_insert(a):
         print("✅ Materialized after insert")
 
 
-# ---------------- main ----------------
+# ---------------- argument parsers ----------------
+# Each command's arguments are declared in its own builder; main() only runs
+# the builder of the command actually invoked (see _COMMANDS).
 
-def main():
-    p = argparse.ArgumentParser(prog="pints", description="PINTS DuckDB utilities (Core + Plugins)")
-    sub = p.add_subparsers(dest="cmd", required=True)
-
-    # Core
-    s = sub.add_parser("init", help="Create core schema (idempotent)")
+def _args_init(s):
     _default_db_arg(s)
+    s.add_argument("--seed", action="store_true",
+                   help="Also seed the minimal PSI-MS dictionary (single transaction)")
     s.set_defaults(func=cmd_init)
 
-    s = sub.add_parser("seed", help="Seed minimal PSI-MS dictionary")
+
+def _args_seed(s):
     _default_db_arg(s)
     s.set_defaults(func=cmd_seed)
 
-    s = sub.add_parser("add-sample", help="Upsert a sample")
+
+def _args_add_sample(s):
     _default_db_arg(s)
     s.add_argument("--id", required=True)
     s.add_argument("--type", default=None)
     s.add_argument("--desc", default=None)
     s.set_defaults(func=cmd_add_sample)
 
-    s = sub.add_parser("add-run", help="Upsert a run (requires existing sample)")
+
+def _args_add_run(s):
     _default_db_arg(s)
     s.add_argument("--id", required=True)
     s.add_argument("--sample", required=True)
@@ -310,7 +443,8 @@ def main():
     s.add_argument("--batch", default=None)
     s.set_defaults(func=cmd_add_run)
 
-    s = sub.add_parser("add-feature", help="Upsert a feature (requires existing run)")
+
+def _args_add_feature(s):
     _default_db_arg(s)
     s.add_argument("--id", required=True)
     s.add_argument("--run", required=True)
@@ -320,40 +454,55 @@ def main():
     s.add_argument("--area", type=float, default=None)
     s.set_defaults(func=cmd_add_feature)
 
-    s = sub.add_parser("show-version", help="Print schema/vocab versions")
+
+def _args_show_version(s):
     _default_db_arg(s)
     s.set_defaults(func=cmd_show_version)
 
-    s = sub.add_parser("list-tables", help="Show tables in the DB")
+
+def _args_list_tables(s):
     _default_db_arg(s)
     s.set_defaults(func=cmd_list_tables)
 
-    s = sub.add_parser("export", help="Export a table or view to CSV")
+
+def _args_export(s):
     _default_db_arg(s)
     s.add_argument("table", help="Table or view name (e.g. features, v_field_semantics)")
-    s.add_argument("--out", required=True, help="Output CSV file")
+    s.add_argument("--out", required=True, help="Output file")
+    s.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Output format (default: %(default)s)")
     s.add_argument("--no-header", action="store_true", help="Disable header row in CSV")
     s.set_defaults(func=cmd_export)
 
-    # Plugins / generic SQL
-    s = sub.add_parser("migrate", help="Apply a local .sql file to the DB (plugins or migrations)")
+
+def _args_import(s):
+    _default_db_arg(s)
+    s.add_argument("table", choices=["samples", "runs", "features"], help="Core table to upsert into")
+    s.add_argument("--csv", required=True, help="CSV file with a header row naming the table's columns")
+    s.set_defaults(func=cmd_import)
+
+
+def _args_migrate(s):
     _default_db_arg(s)
     s.add_argument("--file", required=True, help="Path to .sql file")
     s.set_defaults(func=cmd_migrate)
 
-    s = sub.add_parser("run-sql", help="Run a SELECT or DDL/DML statement (or a .sql file) and print result")
+
+def _args_run_sql(s):
     _default_db_arg(s)
     s.add_argument("--query", required=True, help='Either a SELECT like "SELECT 1" or a path to .sql')
     s.set_defaults(func=cmd_run_sql)
 
-    s = sub.add_parser("export-sql", help="Export the result of a SELECT (or .sql file) to CSV")
+
+def _args_export_sql(s):
     _default_db_arg(s)
     s.add_argument("--query", required=True, help='Either a SELECT like "SELECT * FROM features" or a path to .sql')
-    s.add_argument("--out", required=True, help="Output CSV file")
+    s.add_argument("--out", required=True, help="Output file")
+    s.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Output format (default: %(default)s)")
     s.add_argument("--no-header", action="store_true", help="Disable header row in CSV")
     s.set_defaults(func=cmd_export_sql)
 
-    s = sub.add_parser("set-prop", help="Set an algorithm-specific property (generic key–value store)")
+
+def _args_set_prop(s):
     _default_db_arg(s)
     s.add_argument("--level", required=True, choices=["feature", "component_intra", "run"])
     s.add_argument("--id", required=True, help="Entity id: feature_id / intra_run_component_id / run_id")
@@ -364,14 +513,15 @@ def main():
     s.add_argument("--uri", default=None)
     s.set_defaults(func=cmd_set_prop)
 
-    s = sub.add_parser("get-props", help="Fetch algorithm-specific properties for an entity")
+
+def _args_get_props(s):
     _default_db_arg(s)
     s.add_argument("--level", required=True, choices=["feature", "component_intra", "run"])
     s.add_argument("--id", required=True)
     s.set_defaults(func=cmd_get_props)
 
-    # Plugin command group (manifest-driven)
-    s = sub.add_parser("plugin", help="Generic plugin commands (manifest-driven)")
+
+def _args_plugin(s):
     _default_db_arg(s)
     sp = s.add_subparsers(dest="plugin_cmd", required=True)
 
@@ -396,7 +546,7 @@ def main():
     s4 = sp.add_parser("load-csv", help="Load CSV into staging (columns from manifest)")
     _default_db_arg(s4)
     s4.add_argument("--name", required=True)
-    s4.add_argument("--csv", required=True)
+    s4.add_argument("--csv", required=True, nargs="+", help="One or more CSV files (or a quoted glob like 'dir/*.csv')")
     s4.add_argument("--root", default=None)
     s4.set_defaults(func=cmd_plugin_load_csv)
 
@@ -429,14 +579,56 @@ def main():
     s8 = sp.add_parser("insert", help="Insert rows directly into staging (values parsed by manifest order)")
     _default_db_arg(s8)
     s8.add_argument("--name", required=True, help="Plugin name")
-    s8.add_argument("--rows", required=True, nargs="+",
-                    help="One or more rows like 'R001,R001_F0001,C001' (order must match manifest staging.columns)")
-    s8.add_argument("--delimiter", default=",", help="Field delimiter in --rows (default: ',')")
+    src = s8.add_mutually_exclusive_group(required=True)
+    src.add_argument("--rows", nargs="+",
+                     help="One or more rows like 'R001,R001_F0001,C001' (order must match manifest staging.columns)")
+    src.add_argument("--rows-file", default=None,
+                     help="Headerless delimited file with one row per line (same column order as --rows)")
+    s8.add_argument("--delimiter", default=",", help="Field delimiter in --rows/--rows-file (default: ',')")
     s8.add_argument("--materialize", action="store_true", help="Run 'materialize' after inserting")
     s8.add_argument("--root", default=None, help="Custom plugin root")
     s8.set_defaults(func=cmd_plugin_insert)
 
-    args = p.parse_args()
+
+# name -> (help, argument builder), in the order shown by `pints --help`
+_COMMANDS = {
+    # Core
+    "init": ("Create core schema (idempotent)", _args_init),
+    "seed": ("Seed minimal PSI-MS dictionary", _args_seed),
+    "add-sample": ("Upsert a sample", _args_add_sample),
+    "add-run": ("Upsert a run (requires existing sample)", _args_add_run),
+    "add-feature": ("Upsert a feature (requires existing run)", _args_add_feature),
+    "show-version": ("Print schema/vocab versions", _args_show_version),
+    "list-tables": ("Show tables in the DB", _args_list_tables),
+    "import": ("Upsert samples/runs/features from a CSV file", _args_import),
+    "export": ("Export a table or view to CSV or Parquet", _args_export),
+    # Plugins / generic SQL
+    "migrate": ("Apply a local .sql file to the DB (plugins or migrations)", _args_migrate),
+    "run-sql": ("Run a SELECT or DDL/DML statement (or a .sql file) and print result", _args_run_sql),
+    "export-sql": ("Export the result of a SELECT (or .sql file) to CSV or Parquet", _args_export_sql),
+    "set-prop": ("Set an algorithm-specific property (generic key–value store)", _args_set_prop),
+    "get-props": ("Fetch algorithm-specific properties for an entity", _args_get_props),
+    # Plugin command group (manifest-driven)
+    "plugin": ("Generic plugin commands (manifest-driven)", _args_plugin),
+}
+
+
+# ---------------- main ----------------
+
+def main(argv: Optional[list[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    p = argparse.ArgumentParser(prog="pints", description="PINTS DuckDB utilities (Core + Plugins)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    # Every command is registered (so --help and choice errors list them all),
+    # but only the invoked one gets its arguments built.
+    invoked = next((tok for tok in argv if not tok.startswith("-")), None)
+    for name, (help_text, build) in _COMMANDS.items():
+        s = sub.add_parser(name, help=help_text)
+        if name == invoked:
+            build(s)
+
+    args = p.parse_args(argv)
     args.func(args)
 
 
@@ -8,9 +8,18 @@ PINTS Core SQL schema (from pints-core-sql).
 Features:
 - init_schema(): create core tables/views (idempotent)
 - seed_minimal_vocab(): insert PSI-MS/UO dictionary entries (+ tiny demo)
+- bootstrap(): both of the above in a single transaction
 - add_sample(), add_run(), add_feature(): convenience upserts
-- export_table(): export any table/view to CSV
+- add_samples_bulk(), add_runs_bulk(), add_features_bulk(): DataFrame/Arrow upserts
+- add_features_arrays(): upsert features from parallel NumPy arrays
+- import_samples_csv(), import_runs_csv(), import_features_csv(): CSV upserts
+- export_table() / export_parquet(): export any table/view to CSV / Parquet
 - fetch_df(): run a SELECT and return a pandas DataFrame
+- fetch_arrow() / fetch_polars(): same, as a pyarrow Table / polars DataFrame
+
+Connection settings can be tuned through the environment:
+PINTS_DUCKDB_THREADS, PINTS_DUCKDB_MEMORY (e.g. "16GB") and
+PINTS_DUCKDB_TEMP_DIR; unset values keep DuckDB's defaults.
 
 The SQL files are expected to be vendored into pints/sql/
 (e.g., via a sync script from the pints-core-sql repo).
@@ -18,40 +27,276 @@ The SQL files are expected to be vendored into pints/sql/
 
 from __future__ import annotations
 
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from importlib.resources import files
-from typing import Optional, Any, Dict, Iterable
-import yaml
-import duckdb
+from typing import TYPE_CHECKING, Optional, Any, Dict, Iterable, Iterator
+
+# duckdb and yaml are imported on first use: CLI calls that never touch
+# plugins skip yaml, and `pints --help` skips both
+if TYPE_CHECKING:
+    import duckdb
 
 
+@lru_cache(maxsize=None)
 def _load_sql(name: str) -> str:
     """
-    Load a .sql file bundled under pints/sql/.
+    Load a .sql file bundled under pints/sql/ (read once per process).
     Example names: 'pints_core_v1.sql', 'pints_core_seed_v1.sql'
     """
     return files("pints").joinpath("sql", name).read_text(encoding="utf-8")
 
 
+# Environment overrides applied to every connection PintsDB opens
+# (DuckDB's own defaults are used for anything not set)
+_ENV_SETTINGS = {
+    "PINTS_DUCKDB_THREADS": "threads",           # e.g. 8
+    "PINTS_DUCKDB_MEMORY": "memory_limit",       # e.g. 16GB
+    "PINTS_DUCKDB_TEMP_DIR": "temp_directory",   # spill directory for large sorts/joins
+}
+
+
+def _apply_settings(con: duckdb.DuckDBPyConnection) -> None:
+    """Apply $PINTS_DUCKDB_* overrides and enable the Parquet metadata cache."""
+    import duckdb
+    for env, setting in _ENV_SETTINGS.items():
+        value = os.environ.get(env)
+        if value:
+            con.execute(f"SET GLOBAL {setting} = ?", [int(value) if setting == "threads" else value])
+    try:
+        con.execute("SET GLOBAL parquet_metadata_cache = true")
+    except duckdb.Error:  # older DuckDB: same cache behind the object-cache pragma
+        con.execute("PRAGMA enable_object_cache")
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a (possibly schema-qualified) identifier for interpolation into SQL."""
+    return ".".join('"' + part.replace('"', '""') + '"' for part in name.split("."))
+
+
+def _copy_to(con: duckdb.DuckDBPyConnection, select_sql: str, path: str | Path,
+             options: str, params: Optional[Iterable[Any]] = None) -> None:
+    """
+    COPY (select_sql) TO path (options), binding the path as a parameter.
+    DuckDB numbers COPY's target before the query's own '?' placeholders, so
+    when the query has parameters the path is inlined as a quoted literal.
+    """
+    if params:
+        path_lit = "'" + str(path).replace("'", "''") + "'"
+        con.execute(f"COPY ({select_sql}) TO {path_lit} ({options});", list(params))
+    else:
+        con.execute(f"COPY ({select_sql}) TO ? ({options});", [str(path)])
+
+
+# Column order of the core entity tables, as written by the upsert helpers
+_CORE_COLUMNS = {
+    "samples": ("sample_id", "sample_type", "description"),
+    "runs": ("run_id", "sample_id", "acq_time_utc", "instrument", "method_id", "batch_id"),
+    "features": ("feature_id", "run_id", "sample_id", "mz", "rt", "area"),
+}
+
+# Columns an upsert leaves untouched on existing rows. runs.sample_id is a
+# foreign key column: DuckDB cannot UPDATE a row's foreign-key columns
+# while other tables reference the row (features -> runs), not even to the
+# same value. Upserts therefore never write it; _reassign_run_samples()
+# moves unreferenced runs to their new sample beforehand and rejects the
+# move for runs that features already point at.
+_KEEP_ON_CONFLICT = {"runs": ("sample_id",)}
+
+
+def _on_conflict(table: str) -> str:
+    """ON CONFLICT clause updating the non-key columns of a core table in place."""
+    key, *cols = _CORE_COLUMNS[table]
+    keep = _KEEP_ON_CONFLICT.get(table, ())
+    sets = ", ".join(f"{c} = excluded.{c}" for c in cols if c not in keep)
+    return f"ON CONFLICT ({key}) DO UPDATE SET {sets}"
+
+
+def _reassign_run_samples(con: duckdb.DuckDBPyConnection, source: str, params: Iterable[Any] = ()) -> None:
+    """
+    Apply sample_id changes of existing runs in relation `source`.
+    Raises ValueError (changing nothing) if any such run is referenced by
+    features, since DuckDB cannot update the foreign key of those rows.
+    """
+    params = list(params)
+    clash = con.execute(
+        f"SELECT s.run_id, r.sample_id, s.sample_id FROM {source} s JOIN runs r ON r.run_id = s.run_id "
+        f"WHERE r.sample_id IS DISTINCT FROM s.sample_id "
+        f"AND EXISTS (SELECT 1 FROM features f WHERE f.run_id = r.run_id) LIMIT 1",
+        params,
+    ).fetchone()
+    if clash:
+        run_id, old, new = clash
+        raise ValueError(
+            f"Run {run_id!r} belongs to sample {old!r} and cannot be moved to {new!r} while features "
+            f"reference it: DuckDB does not support updating the foreign key runs.sample_id in place"
+        )
+    con.execute(
+        f"UPDATE runs SET sample_id = s.sample_id FROM {source} s "
+        f"WHERE runs.run_id = s.run_id AND runs.sample_id IS DISTINCT FROM s.sample_id",
+        params,
+    )
+
+
+def _upsert_from(con: duckdb.DuckDBPyConnection, table: str, source: str) -> int:
+    """
+    Upsert every row of relation `source` into a core table in one statement.
+    A key that occurs more than once keeps its last row, as row-by-row
+    upserts would (a single INSERT ... ON CONFLICT would keep the first).
+    """
+    key = _CORE_COLUMNS[table][0]
+    cols = ", ".join(_CORE_COLUMNS[table])
+    if con.execute(f"SELECT 1 FROM {source} GROUP BY {key} HAVING count(*) > 1 LIMIT 1").fetchone():
+        # a temp table keeps the input order in its rowids
+        con.execute(f"CREATE OR REPLACE TEMP TABLE _pints_dedup AS SELECT {cols} FROM {source}")
+        con.execute(f"DELETE FROM _pints_dedup WHERE rowid NOT IN "
+                    f"(SELECT max(rowid) FROM _pints_dedup GROUP BY {key})")
+        source = "_pints_dedup"
+    if table == "runs":
+        _reassign_run_samples(con, source)
+    n = con.execute(
+        f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {source} {_on_conflict(table)}"
+    ).fetchone()[0]
+    # (on error the temp table goes with the rollback, or is replaced next time)
+    con.execute("DROP TABLE IF EXISTS _pints_dedup")
+    return n
+
+
+# Single-row upsert per core table (used by add_*())
+_UPSERT_SQL = {
+    table: f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))}) {_on_conflict(table)}"
+    for table, cols in _CORE_COLUMNS.items()
+}
+
+# Parquet row group size used by the exports (DuckDB's default)
+_PARQUET_ROW_GROUP = 122_880
+
+# Buffered rows (all tables together) that trigger an automatic flush()
+_BATCH_FLUSH_ROWS = 10_000
+
+
+class _TxCursor:
+    """
+    Cursor of the transaction open on this thread, as handed out by
+    _connect() so PintsDB methods join it; close() is a no-op because the
+    cursor belongs to transaction().
+    """
+
+    __slots__ = ("_cur",)
+
+    def __init__(self, cur: duckdb.DuckDBPyConnection):
+        self._cur = cur
+
+    def __getattr__(self, name: str):
+        return getattr(self._cur, name)
+
+    def close(self) -> None:
+        pass
+
+
 class PintsDB:
     """
     High-level API for interacting with a PINTS DuckDB database.
 
+    One DuckDB connection is opened lazily and reused by every method;
+    call close() (or use the instance as a context manager) to release it.
+
     Example:
-        db = PintsDB("pints.duckdb")
-        db.init_schema()
-        db.seed_minimal_vocab()
-        db.add_sample("S001", "Sample", "River water")
-        db.add_run("R001", "S001", "2025-09-12 09:00:00", "QTOF-XYZ", "POS_5min", "B01")
-        db.add_feature("R001_F0001", "R001", mz=301.123456, rt=312.4, area=154321.2)
+        with PintsDB("pints.duckdb") as db:
+            db.init_schema()
+            db.seed_minimal_vocab()
+            db.add_sample("S001", "Sample", "River water")
+            db.add_run("R001", "S001", "2025-09-12 09:00:00", "QTOF-XYZ", "POS_5min", "B01")
+            db.add_feature("R001_F0001", "R001", "S001", mz=301.123456, rt=312.4, area=154321.2)
     """
 
     def __init__(self, db_path: str | Path = "pints.duckdb"):
         self.db_path = Path(db_path)
+        self._con: duckdb.DuckDBPyConnection | None = None
+        self._con_lock = threading.Lock()
+        # table -> buffered parameter rows while begin_batch() is active
+        self._buffers: dict[str, list[list[Any]]] | None = None
+        # manifest path -> (mtime_ns, parsed manifest)
+        self._manifest_cache: dict[str, tuple[int, dict]] = {}
+        # (plugin, action, root) -> (manifest, action file mtime_ns, (sql_text, param names, defaults))
+        self._action_cache: dict[tuple, tuple[dict, int, tuple[str, list[str], list[Any]]]] = {}
+        # lower-cased table/view names ("name" and "schema.name"), see _relation()
+        self._relations: set[str] | None = None
+        # algo_properties DDL already run on this instance (see set_algo_property)
+        self._algo_props_ready = False
+        # .cursor: cursor of the transaction() open on the current thread, if any
+        self._tx = threading.local()
 
     # ---------------- internal ----------------
     def _connect(self) -> duckdb.DuckDBPyConnection:
-        return duckdb.connect(str(self.db_path))
+        """
+        Return a cursor on the cached connection.
+        Cursors share the open database (catalog, buffer pool) but keep their
+        own transaction state; closing one leaves the connection open.
+        Inside transaction() this is the transaction's cursor instead.
+        """
+        tx = getattr(self._tx, "cursor", None)
+        if tx is not None:
+            return _TxCursor(tx)
+        return self.connection.cursor()
+
+    # ---------------- connection ----------------
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        """Long-lived connection, opened on first use and kept until close()."""
+        if self._con is None:
+            with self._con_lock:
+                if self._con is None:
+                    import duckdb
+                    con = duckdb.connect(str(self.db_path))
+                    _apply_settings(con)
+                    self._con = con
+        return self._con
+
+    def close(self) -> None:
+        """Flush any batched rows, then close the cached connection (safe to call repeatedly)."""
+        if self._buffers:
+            self.flush()
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+    def __enter__(self) -> PintsDB:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._buffers = None  # don't write a half-finished batch
+        self.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Run a block as one transaction (rolled back on error).
+        PintsDB methods called inside the block on the same thread take part
+        in it, and nested transaction() blocks join the outer one.
+        """
+        tx = getattr(self._tx, "cursor", None)
+        if tx is not None:
+            yield tx
+            return
+        con = self.connection.cursor()
+        con.execute("BEGIN TRANSACTION")
+        self._tx.cursor = con
+        try:
+            yield con
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        else:
+            con.execute("COMMIT")
+        finally:
+            self._tx.cursor = None
+            con.close()
 
     # ---------------- schema & seed ----------------
     def init_schema(self) -> None:
@@ -66,15 +311,37 @@ class PintsDB:
         con.execute(_load_sql("seeds/pints_core_seed_v1.sql"))
         con.close()
 
+    def bootstrap(self) -> None:
+        """
+        init_schema() + seed_minimal_vocab() as one transaction (one commit/WAL sync).
+        The seed is skipped if the database is already seeded, since its demo
+        rows cannot be inserted twice.
+        """
+        with self.transaction() as con:
+            con.execute(_load_sql("core/pints_core_v1.sql"))
+            if con.execute("SELECT count(*) FROM vocabulary_info").fetchone()[0] == 0:
+                con.execute(_load_sql("seeds/pints_core_seed_v1.sql"))
+
     # ---------------- inserts (upserts) ----------------
-    def add_sample(self, sample_id: str, sample_type: str | None = None, description: str | None = None) -> None:
+    def _upsert(self, table: str, row: list[Any]) -> None:
+        if self._buffers is not None:
+            self._buffers[table].append(row)
+            if sum(map(len, self._buffers.values())) >= _BATCH_FLUSH_ROWS:
+                self.flush()
+            return
+        if table == "runs":
+            # sample_id move + upsert must apply together
+            with self.transaction() as con:
+                _reassign_run_samples(con, "(SELECT ?::VARCHAR AS run_id, ?::VARCHAR AS sample_id)", row[:2])
+                con.execute(_UPSERT_SQL[table], row)
+            return
         con = self._connect()
-        con.execute(
-            "INSERT OR REPLACE INTO samples (sample_id, sample_type, description) VALUES (?,?,?)",
-            [sample_id, sample_type, description],
-        )
+        con.execute(_UPSERT_SQL[table], row)
         con.close()
 
+    def add_sample(self, sample_id: str, sample_type: str | None = None, description: str | None = None) -> None:
+        self._upsert("samples", [sample_id, sample_type, description])
+
     def add_run(
         self,
         run_id: str,
@@ -84,40 +351,174 @@ class PintsDB:
         method_id: str | None = None,
         batch_id: str | None = None,
     ) -> None:
-        con = self._connect()
-        con.execute(
-            """
-            INSERT OR REPLACE INTO runs
-              (run_id, sample_id, acq_time_utc, instrument, method_id, batch_id)
-            VALUES (?,?,?,?,?,?)
-            """,
-            [run_id, sample_id, acq_time_utc, instrument, method_id, batch_id],
-        )
-        con.close()
+        """
+        Upsert a run. An existing run can move to another sample only while
+        no features reference it: DuckDB cannot update that foreign key in
+        place, so a different sample_id then raises ValueError.
+        """
+        self._upsert("runs", [run_id, sample_id, acq_time_utc, instrument, method_id, batch_id])
 
     def add_feature(self, feature_id: str, run_id: str, sample_id: str, mz: float, rt: float | None = None, area: float | None = None) -> None:
-        con = self._connect()
-        con.execute(
-            """
-            INSERT OR REPLACE INTO features
-              (feature_id, run_id, sample_id, mz, rt, area)
-            VALUES (?,?,?,?,?,?)
-            """,
-            [feature_id, run_id, sample_id, mz, rt, area],
-        )
-        con.close()
+        self._upsert("features", [feature_id, run_id, sample_id, mz, rt, area])
+
+    # ---------------- batched inserts ----------------
+    def begin_batch(self) -> None:
+        """
+        Buffer subsequent add_sample/add_run/add_feature calls instead of
+        writing them one by one. Rows are written by flush() (automatically
+        every _BATCH_FLUSH_ROWS rows) and by end_batch()/close().
+        """
+        if self._buffers is None:
+            self._buffers = {table: [] for table in _CORE_COLUMNS}
+
+    def flush(self) -> None:
+        """Write buffered rows with one bulk upsert per table inside a single transaction."""
+        if not self._buffers:
+            return
+        import pandas as pd
+
+        with self.transaction() as con:
+            # _CORE_COLUMNS order (samples, runs, features) satisfies the foreign keys
+            for table, rows in self._buffers.items():
+                if rows:
+                    frame = pd.DataFrame.from_records(rows, columns=_CORE_COLUMNS[table])
+                    self._bulk_upsert_on(con, table, frame)
+        for rows in self._buffers.values():
+            rows.clear()
+
+    def end_batch(self) -> None:
+        """Flush buffered rows and return to row-at-a-time writes (also if the flush fails)."""
+        try:
+            self.flush()
+        finally:
+            self._buffers = None
+
+    # ---------------- bulk inserts (upserts) ----------------
+    @staticmethod
+    def _bulk_upsert_on(con: duckdb.DuckDBPyConnection, table: str, data) -> int:
+        """Upsert every row of a pandas DataFrame / Arrow table into a core table (last row per key wins)."""
+        con.register("_pints_stage", data)
+        try:
+            return _upsert_from(con, table, "_pints_stage")
+        finally:
+            con.unregister("_pints_stage")
+
+    def _bulk_upsert(self, table: str, data) -> int:
+        with self.transaction() as con:
+            return self._bulk_upsert_on(con, table, data)
+
+    def add_samples_bulk(self, samples) -> int:
+        """Upsert samples from a DataFrame/Arrow table with columns sample_id, sample_type, description."""
+        return self._bulk_upsert("samples", samples)
+
+    def add_runs_bulk(self, runs) -> int:
+        """
+        Upsert runs from a DataFrame/Arrow table with the columns of `runs`.
+        sample_id changes follow add_run() (ValueError for runs with features).
+        """
+        return self._bulk_upsert("runs", runs)
+
+    def add_features_bulk(self, features) -> int:
+        """
+        Upsert features from a pandas DataFrame or pyarrow Table with columns
+        feature_id, run_id, sample_id, mz, rt, area.
+        The frame is registered with DuckDB and ingested by a single
+        INSERT ... SELECT inside one transaction; returns the row count.
+        """
+        return self._bulk_upsert("features", features)
+
+    def add_features_arrays(self, feature_ids, run_ids, sample_ids, mz, rt, area) -> int:
+        """
+        Upsert features given as parallel arrays (one array per column, e.g.
+        straight from a feature detector). mz/rt/area are taken as float64;
+        None/NaN entries are stored as NULL, as add_feature() would. Columns
+        are handed to DuckDB as a pyarrow Table (zero-copy for numeric arrays
+        without missing values) or, without pyarrow, a pandas DataFrame.
+        """
+        import numpy as np
+        ids = {
+            "feature_id": np.asarray(feature_ids, dtype=object),
+            "run_id": np.asarray(run_ids, dtype=object),
+            "sample_id": np.asarray(sample_ids, dtype=object),
+        }
+        nums = {
+            "mz": np.asarray(mz, dtype="f8"),
+            "rt": np.asarray(rt, dtype="f8"),
+            "area": np.asarray(area, dtype="f8"),
+        }
+        if len({len(a) for a in (*ids.values(), *nums.values())}) > 1:
+            raise ValueError("add_features_arrays: all arrays must have the same length")
+        try:
+            import pyarrow as pa
+            # from_pandas=True: NaN becomes a null, not a stored NaN value
+            data = pa.table({**ids, **{k: pa.array(v, type=pa.float64(), from_pandas=True)
+                                       for k, v in nums.items()}})
+        except ImportError:
+            import pandas as pd
+            data = pd.DataFrame({**ids, **{k: pd.array(v, dtype="Float64") for k, v in nums.items()}})
+        return self._bulk_upsert("features", data)
+
+    def _import_csv(self, table: str, csv_path: str | Path) -> int:
+        """Upsert a headered CSV into a core table with DuckDB's CSV reader (no Python per row)."""
+        cols = ", ".join(_CORE_COLUMNS[table])
+        with self.transaction() as con:
+            # parse the file once; the duplicate/run checks then scan the temp table
+            con.execute(f"CREATE OR REPLACE TEMP TABLE _pints_csv AS "
+                        f"SELECT {cols} FROM read_csv_auto(?, header = true)", [str(csv_path)])
+            n = _upsert_from(con, table, "_pints_csv")
+            con.execute("DROP TABLE _pints_csv")
+            return n
+
+    def import_samples_csv(self, csv_path: str | Path) -> int:
+        """Upsert samples from a CSV with header sample_id, sample_type, description; returns the row count."""
+        return self._import_csv("samples", csv_path)
+
+    def import_runs_csv(self, csv_path: str | Path) -> int:
+        """Upsert runs from a CSV whose header names the `runs` columns (sample_id rules as in add_run)."""
+        return self._import_csv("runs", csv_path)
+
+    def import_features_csv(self, csv_path: str | Path) -> int:
+        """
+        Upsert features from a CSV with header feature_id, run_id, sample_id,
+        mz, rt, area (extra columns are ignored). The file is read by DuckDB's
+        parallel CSV reader straight into the table, in one transaction.
+        """
+        return self._import_csv("features", csv_path)
 
     # ---------------- exports & queries ----------------
+    def _relation(self, table: str) -> str:
+        """Validate a table/view name against the catalog and return it quoted."""
+        key = table.lower()
+        if self._relations is None or key not in self._relations:
+            # (re)load on a miss: tables may have been created since the last lookup
+            con = self._connect()
+            rows = con.execute(
+                "SELECT table_schema, table_name FROM information_schema.tables"
+            ).fetchall()
+            con.close()
+            self._relations = {n.lower() for _, n in rows} | {f"{sc}.{n}".lower() for sc, n in rows}
+        if key not in self._relations:
+            raise ValueError(f"Unknown table or view: {table!r}")
+        return _quote_ident(table)
+
     def export_table(self, table: str, csv_path: str, header: bool = True) -> None:
         """
         Export a table or view to CSV using DuckDB COPY.
         """
-        con = self._connect()
-        # COPY requires a string literal for the path → quote safely
-        path_lit = "'" + str(csv_path).replace("'", "''") + "'"
+        rel = self._relation(table)
         header_clause = "HEADER" if header else "HEADER FALSE"
-        con.execute(f"COPY (SELECT * FROM {table}) TO {path_lit} (DELIMITER ',', {header_clause});")
-        con.close()
+        con = self._connect()
+        try:
+            _copy_to(con, f"SELECT * FROM {rel}", csv_path, f"DELIMITER ',', {header_clause}")
+        finally:
+            con.close()
+
+    def export_parquet(self, table: str, parquet_path: str, compression: str = "zstd") -> None:
+        """
+        Export a table or view to Parquet using DuckDB COPY.
+        Columnar and compressed: much smaller and faster to reload than CSV.
+        """
+        self.export_sql_parquet(f"SELECT * FROM {self._relation(table)}", parquet_path, compression=compression)
 
     def fetch_df(self, sql: str):
         """Run a SELECT query and return a pandas DataFrame."""
@@ -126,20 +527,43 @@ class PintsDB:
         con.close()
         return df
 
+    def fetch_arrow(self, sql: str, params: Optional[Iterable[Any]] = None):
+        """Run a SELECT query and return a pyarrow Table (columnar, no pandas; requires pyarrow)."""
+        con = self._connect()
+        try:
+            res = con.execute(sql, list(params) if params is not None else None)
+            # to_arrow_table() supersedes fetch_arrow_table() in newer DuckDB releases
+            return res.to_arrow_table() if hasattr(res, "to_arrow_table") else res.fetch_arrow_table()
+        finally:
+            con.close()
+
+    def fetch_polars(self, sql: str, params: Optional[Iterable[Any]] = None):
+        """Run a SELECT query and return a polars DataFrame (requires polars)."""
+        con = self._connect()
+        try:
+            return con.execute(sql, list(params) if params is not None else None).pl()
+        finally:
+            con.close()
+
     def get_table_df(self, table: str):
         """Convenience: SELECT * FROM <table> as pandas DataFrame."""
+        rel = self._relation(table)
         con = self._connect()
-        df = con.execute(f"SELECT * FROM {table}").fetchdf()
+        df = con.execute(f"SELECT * FROM {rel}").fetchdf()
         con.close()
         return df
 
     # ---------------- lookups ----------------
     def get_feature(self, feature_id: str) -> Optional[Dict[str, Any]]:
+        """Return one feature as a column -> value dict (None if absent)."""
         con = self._connect()
-        df = con.execute("SELECT * FROM features WHERE feature_id = ?", [feature_id]).fetchdf()
-        con.close()
-        return None if df.empty else df.iloc[0].to_dict()
-    
+        try:
+            cur = con.execute("SELECT * FROM features WHERE feature_id = ? LIMIT 1", [feature_id])
+            row = cur.fetchone()
+            return None if row is None else dict(zip([d[0] for d in cur.description], row))
+        finally:
+            con.close()
+
     # ---------------- plugin/migration support ----------------
     def migrate(self, sql_file: str | Path) -> None:
         """Apply a migration or plugin SQL file (idempotent encouraged)."""
@@ -150,6 +574,7 @@ class PintsDB:
 
     def run_sql(self, sql: str, params: Optional[Iterable[Any]] = None):
         """Execute arbitrary SQL (useful for plugins). Returns pandas DataFrame for SELECTs."""
+        import duckdb
         con = self._connect()
         try:
             if params is None:
@@ -170,27 +595,34 @@ class PintsDB:
                           unit_code: str | None = None, ontology_uri: str | None = None) -> None:
         """Upsert an algorithm-specific property (creates table if missing)."""
         con = self._connect()
+        if not self._algo_props_ready:
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS algo_properties (
+                  level TEXT NOT NULL,
+                  entity_id TEXT NOT NULL,
+                  prop_key TEXT NOT NULL,
+                  prop_value DOUBLE,
+                  value_text TEXT,
+                  unit_code TEXT,
+                  ontology_uri TEXT,
+                  PRIMARY KEY (level, entity_id, prop_key)
+                );
+            """)
+            # inside transaction() the DDL may still be rolled back: only latch outside one
+            self._algo_props_ready = getattr(self._tx, "cursor", None) is None
         con.execute("""
-            CREATE TABLE IF NOT EXISTS algo_properties (
-              level TEXT NOT NULL,
-              entity_id TEXT NOT NULL,
-              prop_key TEXT NOT NULL,
-              prop_value DOUBLE,
-              value_text TEXT,
-              unit_code TEXT,
-              ontology_uri TEXT,
-              PRIMARY KEY (level, entity_id, prop_key)
-            );
-        """)
-        con.execute("""
-            INSERT OR REPLACE INTO algo_properties
+            INSERT INTO algo_properties
               (level, entity_id, prop_key, prop_value, value_text, unit_code, ontology_uri)
             VALUES (?,?,?,?,?,?,?)
+            ON CONFLICT (level, entity_id, prop_key) DO UPDATE SET
+              prop_value = excluded.prop_value, value_text = excluded.value_text,
+              unit_code = excluded.unit_code, ontology_uri = excluded.ontology_uri
         """, [level, entity_id, key, value, value_text, unit_code, ontology_uri])
         con.close()
 
     def get_algo_properties(self, level: str, entity_id: str):
         """Return a DataFrame of algo-specific properties for the given entity (or None if table absent)."""
+        import duckdb
         con = self._connect()
         try:
             df = con.execute("""
@@ -209,14 +641,29 @@ class PintsDB:
         """Export the result of a SELECT to CSV (supports bound params)."""
         # Remove trailing semicolon to avoid DuckDB COPY syntax error
         select_sql = select_sql.rstrip().rstrip(';')
-        con = self._connect()
-        path_lit = "'" + str(csv_path).replace("'", "''") + "'"
         header_clause = "HEADER" if header else "HEADER FALSE"
-        if params:
-            con.execute(f"COPY ({select_sql}) TO {path_lit} (DELIMITER ',', {header_clause});", list(params))
-        else:
-            con.execute(f"COPY ({select_sql}) TO {path_lit} (DELIMITER ',', {header_clause});")
-        con.close()
+        con = self._connect()
+        try:
+            _copy_to(con, select_sql, csv_path, f"DELIMITER ',', {header_clause}", params)
+        finally:
+            con.close()
+
+    def export_sql_parquet(self, select_sql: str, parquet_path: str, compression: str = "zstd",
+                           params: Optional[Iterable[Any]] = None) -> None:
+        """Export the result of a SELECT to a Parquet file (supports bound params)."""
+        select_sql = select_sql.rstrip().rstrip(';')
+        options = f"FORMAT PARQUET, COMPRESSION {compression.upper()}, ROW_GROUP_SIZE {_PARQUET_ROW_GROUP}"
+        con = self._connect()
+        try:
+            _copy_to(con, select_sql, parquet_path, options, params)
+        finally:
+            con.close()
+
+    def export_arrow(self, select_sql: str, arrow_path: str, params: Optional[Iterable[Any]] = None) -> None:
+        """Export the result of a SELECT to an Arrow IPC (Feather v2) file (requires pyarrow)."""
+        import pyarrow.feather as feather
+
+        feather.write_feather(self.fetch_arrow(select_sql.rstrip().rstrip(';'), params), str(arrow_path))
     
     # ---------- plugin discovery ----------
     def plugin_root(self, name: str, root: str | Path | None = None) -> Path:
@@ -226,9 +673,20 @@ class PintsDB:
     def plugin_manifest(self, name: str, root: str | Path | None = None) -> dict:
         plugdir = self.plugin_root(name, root)
         mpath = plugdir / "manifest.yaml"
-        if not mpath.exists():
-            raise FileNotFoundError(f"manifest.yaml not found for plugin '{name}' at {mpath}")
-        return yaml.safe_load(mpath.read_text(encoding="utf-8"))
+        try:
+            mtime = mpath.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"manifest.yaml not found for plugin '{name}' at {mpath}") from None
+        key = str(mpath.resolve())
+        cached = self._manifest_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        import yaml
+        # libyaml-backed loader when PyYAML was built with it (several times faster)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        manifest = yaml.load(mpath.read_text(encoding="utf-8"), Loader=loader)
+        self._manifest_cache[key] = (mtime, manifest)
+        return manifest
 
     # ---------- install / schema ----------
     def plugin_install(self, name: str, root: str | Path | None = None) -> None:
@@ -240,75 +698,114 @@ class PintsDB:
         self.migrate(schema_file)
 
     # ---------- staging ----------
+    def _plugin_staging(self, name: str, root: str | Path | None = None) -> tuple[str | None, list, dict]:
+        """Return the manifest's staging (table, columns, load.csv options)."""
+        st = self.plugin_manifest(name, root).get("staging") or {}
+        return st.get("table"), st.get("columns") or [], (st.get("load") or {}).get("csv", {})
+
     def plugin_staging_create(self, name: str, root: str | Path | None = None) -> None:
-        m = self.plugin_manifest(name, root)
-        st = m.get("staging") or {}
-        table = st.get("table")
-        cols  = st.get("columns") or []
+        table, cols, _ = self._plugin_staging(name, root)
         if not table or not cols:
             return  # plugin may not use staging
-        ddl_cols = ", ".join(f"{c['name']} {c['type']}" for c in cols)
+        ddl_cols = ", ".join(f"{_quote_ident(c['name'])} {c['type']}" for c in cols)
         con = self._connect()
-        con.execute(f"CREATE TABLE IF NOT EXISTS {table} ({ddl_cols});")
+        con.execute(f"CREATE TABLE IF NOT EXISTS {_quote_ident(table)} ({ddl_cols});")
         con.close()
 
     def plugin_staging_clear(self, name: str, root: str | Path | None = None) -> None:
-        m = self.plugin_manifest(name, root)
-        st = m.get("staging") or {}
-        table = st.get("table")
+        table, _, _ = self._plugin_staging(name, root)
         if not table:
             return
         con = self._connect()
-        con.execute(f"DELETE FROM {table};")
+        con.execute(f"DELETE FROM {_quote_ident(table)};")
         con.close()
 
-    def plugin_staging_load_csv(self, name: str, csv_path: str, root: str | Path | None = None) -> None:
-        m = self.plugin_manifest(name, root)
-        st = m.get("staging") or {}
-        table = st.get("table")
-        cols  = st.get("columns") or []
-        load  = (st.get("load") or {}).get("csv", {})
+    def plugin_staging_load_csv(self, name: str, csv_path: str, root: str | Path | None = None) -> int:
+        """Load one CSV into staging (see plugin_staging_load_csvs); returns the number of rows loaded."""
+        return self.plugin_staging_load_csvs(name, [csv_path], root)
+
+    def plugin_staging_load_csvs(self, name: str, csv_paths: str | Iterable[str],
+                                 root: str | Path | None = None) -> int:
+        """
+        Load many CSVs into staging with a single read_csv() scan.
+        csv_paths is a list of files or a glob such as 'exports/*.csv'; the
+        manifest's load.csv options and column types apply to every file.
+        Returns the number of rows loaded.
+        """
+        table, cols, load = self._plugin_staging(name, root)
         if not table or not cols:
             raise ValueError(f"Plugin '{name}' does not define staging.table/columns in manifest.")
-        # ensure table exists
         self.plugin_staging_create(name, root)
-        # COPY options
+        sources = str(csv_paths) if isinstance(csv_paths, (str, Path)) else [str(p) for p in csv_paths]
+        if not sources:
+            return 0  # read_csv() rejects an empty file list
         header     = load.get("header", True)
         autodetect = load.get("autodetect", True)
         delim      = load.get("delimiter", ",")
-        path_lit = "'" + str(csv_path).replace("'", "''") + "'"
-        header_opt = "HEADER" if header else "HEADER FALSE"
-        autod_opt  = "AUTO_DETECT TRUE" if autodetect else ""
-        delim_opt  = f"DELIMITER '{delim}'" if delim else ""
-        col_list = ", ".join(c["name"] for c in cols)
-        opts = ", ".join([o for o in [autod_opt, header_opt, delim_opt] if o])
+        # typed columns (as COPY into the staging table would use) map fields by position
+        columns = ", ".join("'" + c["name"].replace("'", "''") + f"': '{c['type']}'" for c in cols)
+        opts = [f"header = {str(bool(header)).lower()}",
+                f"auto_detect = {str(bool(autodetect)).lower()}",
+                f"columns = {{{columns}}}"]
+        if delim:
+            opts.append("delim = ?")
+        col_list = ", ".join(_quote_ident(c["name"]) for c in cols)
         con = self._connect()
-        con.execute(f"COPY {table} ({col_list}) FROM {path_lit} ({opts});")
-        con.close()
+        try:
+            return con.execute(
+                f"INSERT INTO {_quote_ident(table)} ({col_list}) SELECT * FROM read_csv(?, {', '.join(opts)})",
+                [sources] + ([delim] if delim else []),
+            ).fetchone()[0]
+        finally:
+            con.close()
 
     # ---------- actions (materialize/export/any) ----------
-    def _plugin_action_sql(self, name: str, action: str, root: str | Path | None = None) -> str:
+    def _plugin_action(self, name: str, action: str,
+                       root: str | Path | None = None) -> tuple[str, list[str], list[Any]]:
+        """
+        Return (sql_text, param names, param defaults) for an action. The
+        descriptor is reused while neither manifest.yaml (plugin_manifest()
+        hands back the same object until its mtime changes) nor the action's
+        .sql file has changed.
+        """
         m = self.plugin_manifest(name, root)
-        plugdir = self.plugin_root(name, root)
         acts = {a["name"]: a for a in (m.get("actions") or [])}
         if action not in acts:
             raise KeyError(f"Plugin '{name}' has no action named '{action}'")
-        f = plugdir / acts[action]["file"]
-        if not f.exists():
-            raise FileNotFoundError(f"SQL for action '{action}' not found: {f}")
-        return f.read_text(encoding="utf-8"), acts[action]
+        f = self.plugin_root(name, root) / acts[action]["file"]
+        try:
+            mtime = f.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"SQL for action '{action}' not found: {f}") from None
+        key = (name, action, str(root) if root is not None else None)
+        cached = self._action_cache.get(key)
+        if cached is not None and cached[0] is m and cached[1] == mtime:
+            return cached[2]
+        decl = acts[action].get("params") or []
+        desc = (f.read_text(encoding="utf-8"), [p["name"] for p in decl], [p.get("default") for p in decl])
+        self._action_cache[key] = (m, mtime, desc)
+        return desc
 
     def plugin_action_run(self, name: str, action: str, params: Optional[dict] = None,
                           root: str | Path | None = None):
-        sql, meta = self._plugin_action_sql(name, action, root)
-        # Bind params in manifest order if provided
-        values: Optional[list[Any]] = None
-        if params and "params" in meta:
-            order = [p["name"] for p in meta["params"]]
-            values = [params.get(k, p.get("default")) for p, k in zip(meta["params"], order)]
+        sql, names, defaults = self._plugin_action(name, action, root)
+        # Bind params in manifest order, falling back to the declared defaults
+        if not names:
+            return self.run_sql(sql)
+        values = [params.get(n, d) for n, d in zip(names, defaults)] if params else defaults
         return self.run_sql(sql, values)
 
+    def plugin_action_run_many(self, name: str, action: str, list_of_params: Iterable[dict],
+                               root: str | Path | None = None) -> None:
+        """Run an action once per params dict via executemany, in a single transaction."""
+        sql, names, defaults = self._plugin_action(name, action, root)
+        rows = [[params.get(n, d) for n, d in zip(names, defaults)] for params in list_of_params]
+        if not rows:
+            return
+        with self.transaction() as con:
+            con.executemany(sql, rows)
+
     def plugin_export(self, name: str, out_csv: str, action: str = "export",
                       root: str | Path | None = None, header: bool = True):
-        sql, _ = self._plugin_action_sql(name, action, root)
+        sql, _, _ = self._plugin_action(name, action, root)
         self.export_sql(sql, out_csv, header=header)
@@ -17,24 +17,32 @@ Usage:
 
 from __future__ import annotations
 import argparse
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
 DEFAULT_SRC = Path("extern/pints-core-sql/sql")
 DEFAULT_DST = Path("pints/sql")
 CORE_VERSION_FILE = Path("extern/pints-core-sql/VERSION")
+COPY_WORKERS = 8  # small files: copies are syscall-bound, so overlap them
+
+def _copy_one(path: Path, src: Path, dst: Path) -> Path:
+    target = dst / path.relative_to(src)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # copy next to the target and swap it in, so readers never see a partial file
+    tmp = target.with_name(target.name + ".tmp")
+    shutil.copy2(path, tmp)
+    os.replace(tmp, target)
+    return target
 
 def copy_tree(src: Path, dst: Path) -> list[Path]:
     """Copy all .sql files from src/** to dst/** preserving subdirs. Return list of copied files."""
-    copied: list[Path] = []
-    for path in src.rglob("*.sql"):
-        rel = path.relative_to(src)
-        target = dst / rel
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(path, target)
-        copied.append(target)
-        print(f"[pints-sync] copied: {rel}")
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        copied = list(ex.map(lambda p: _copy_one(p, src, dst), src.rglob("*.sql")))
+    for target in copied:
+        print(f"[pints-sync] copied: {target.relative_to(dst)}")
     return copied
 
 def write_core_version(dst: Path, version_file: Path) -> None:
@@ -47,11 +55,12 @@ def write_core_version(dst: Path, version_file: Path) -> None:
     else:
         print("[pints-sync] VERSION file not found in submodule; skipping CORE_VERSION.")
 
-def clean_dst(dst: Path) -> None:
-    """Remove existing .sql files in pints/sql (but keep directory structure if desired)."""
-    if not dst.exists():
-        return
+def remove_stale(dst: Path, keep: list[Path]) -> None:
+    """Remove .sql files in pints/sql that were not just copied (keeps directory structure)."""
+    wanted = set(keep)
     for path in dst.rglob("*.sql"):
+        if path in wanted:
+            continue
         try:
             path.unlink()
         except Exception as e:
@@ -73,13 +82,11 @@ def main():
 
     dst.mkdir(parents=True, exist_ok=True)
 
-    # Clean old SQLs to avoid stale files
-    clean_dst(dst)
-
-    # Copy tree and create shortcuts
+    # Copy tree (overwriting in place), then drop SQLs no longer in the source
     copied = copy_tree(src, dst)
     if not copied:
         print("[pints-sync] warning: no .sql files found under source.")
+    remove_stale(dst, copied)
 
     # Write core version (optional)
     write_core_version(dst, CORE_VERSION_FILE)
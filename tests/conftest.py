@@ -0,0 +1,39 @@
+# tests/conftest.py
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pints.db import PintsDB
+
+
+@pytest.fixture(scope="session")
+def base_db_path(tmp_path_factory) -> Path:
+    # Schema + seed are built once per session; tests work on copies
+    path = tmp_path_factory.mktemp("pints") / "base.duckdb"
+    db = PintsDB(path)
+    db.bootstrap()
+    db.close()  # checkpoints, so the single file is a complete snapshot
+    return path
+
+
+@pytest.fixture
+def db_path(base_db_path: Path, tmp_path: Path) -> Path:
+    path = tmp_path / "pints_test.duckdb"
+    shutil.copy(base_db_path, path)
+    return path
+
+
+@pytest.fixture
+def db(db_path: Path):
+    pdb = PintsDB(db_path)
+    yield pdb
+    pdb.close()
+
+
+@pytest.fixture
+def plugin_root(tmp_path: Path) -> Path:
+    # Writable copy of tests/plugins (tests may edit manifests/action SQL)
+    root = tmp_path / "plugins"
+    shutil.copytree(Path(__file__).parent / "plugins", root)
+    return root
@@ -0,0 +1 @@
+SELECT * FROM demo_final ORDER BY feature_id;
@@ -0,0 +1 @@
+INSERT INTO demo_final SELECT * FROM demo_staging;
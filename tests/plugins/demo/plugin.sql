@@ -0,0 +1 @@
+CREATE TABLE IF NOT EXISTS demo_final (run_id TEXT, feature_id TEXT, score DOUBLE, n INTEGER);
@@ -0,0 +1 @@
+SELECT * FROM demo_final WHERE score >= ? ORDER BY feature_id
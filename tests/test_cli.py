@@ -0,0 +1,139 @@
+# tests/test_cli.py
+import pytest
+
+from pints.cli import _coerce_fn, _parse_params, main
+from pints.db import PintsDB
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("-3", -3),
+    ("1e5", 100000.0),
+    ('"x"', "x"),
+    ("True", True),
+    ("None", None),
+    ("a,b", "a,b"),
+    ("1,2", "1,2"),
+    ("[1, 2]", "[1, 2]"),
+    ("{1}", "{1}"),
+    ("plain", "plain"),
+])
+def test_parse_params_values(raw, expected):
+    assert _parse_params([f"k={raw}"]) == {"k": expected}
+
+
+def test_parse_params_keeps_equals_in_value():
+    assert _parse_params(["expr=a=b"]) == {"expr": "a=b"}
+
+
+def test_parse_params_requires_equals():
+    with pytest.raises(SystemExit):
+        _parse_params(["novalue"])
+
+
+def test_coerce_fn_falls_back_to_string_for_duckdb_cast():
+    to_int = _coerce_fn("INTEGER")
+    assert to_int("3") == 3
+    assert to_int("1.0") == "1.0"  # left for DuckDB's own cast (-> 1)
+    assert _coerce_fn("DOUBLE")("2.5") == 2.5
+    assert _coerce_fn("TEXT")("x") == "x"
+
+
+# ---------------- command dispatch ----------------
+
+
+def _count(db_path, sql):
+    with PintsDB(db_path) as pdb:
+        return pdb.connection.execute(sql).fetchone()[0]
+
+
+def test_help_lists_every_command(capsys):
+    with pytest.raises(SystemExit):
+        main(["--help"])
+    out = capsys.readouterr().out
+    for cmd in ("init", "import", "export", "plugin", "run-sql"):
+        assert cmd in out
+
+
+def test_only_invoked_subcommand_parses_its_arguments(db_path, capsys):
+    main(["list-tables", "--db", str(db_path)])
+    assert "features" in capsys.readouterr().out.split()
+    with pytest.raises(SystemExit):
+        main(["add-sample", "--db", str(db_path)])  # --id is required
+
+
+def test_import_command(db_path, tmp_path, capsys):
+    csv_path = tmp_path / "samples.csv"
+    csv_path.write_text("sample_id,sample_type,description\nCLI1,Sample,x\nCLI2,Blank,\n")
+    main(["import", "samples", "--db", str(db_path), "--csv", str(csv_path)])
+    assert "Imported 2 row(s)" in capsys.readouterr().out
+    assert _count(db_path, "SELECT count(*) FROM samples WHERE sample_id LIKE 'CLI%'") == 2
+
+
+def test_plugin_insert_rows_and_rows_file(db_path, plugin_root, tmp_path):
+    base = ["--db", str(db_path), "--name", "demo", "--root", str(plugin_root)]
+    main(["plugin", "install", *base])
+    main(["plugin", "insert", *base, "--rows", "R001,F1,0.5,1.0", "R001, F2 ,1.5,2"])
+    rows_file = tmp_path / "rows.txt"
+    rows_file.write_text("R001|F3|2.5|3\nR001|F4|3.5|4\n")
+    main(["plugin", "insert", *base, "--rows-file", str(rows_file), "--delimiter", "|", "--materialize"])
+    with PintsDB(db_path) as pdb:
+        assert pdb.fetch_df("SELECT feature_id, n FROM demo_final ORDER BY 1").values.tolist() == [
+            ["F1", 1], ["F2", 2], ["F3", 3], ["F4", 4]
+        ]
+
+
+def test_iter_rows_tokenizes_each_row_on_its_own():
+    from pints.cli import _iter_rows
+
+    conv = [str, str, _coerce_fn("DOUBLE"), _coerce_fn("INTEGER")]
+    names = ["run_id", "feature_id", "score", "n"]
+    assert list(_iter_rows(['R1,"F,1", 0.5 ,1', "R2,F2,0.5,2"], ",", conv, names)) == [
+        ["R1", "F,1", 0.5, 1], ["R2", "F2", 0.5, 2]
+    ]
+    for bad in (['R1,"F1,0.5,1', "R2,F2,0.5,2"], ["R1,F1\nR2,0.5,1"], ["R1,F1,0.5"]):
+        with pytest.raises(SystemExit, match="Row: "):
+            list(_iter_rows(bad, ",", conv, names))
+    assert list(_iter_rows(["R1||F1||0.5||1"], "||", conv, names)) == [["R1", "F1", 0.5, 1]]
+
+
+def test_rows_file_trims_fields_like_rows(db_path, plugin_root, tmp_path):
+    base = ["--db", str(db_path), "--name", "demo", "--root", str(plugin_root)]
+    main(["plugin", "install", *base])
+    main(["plugin", "insert", *base, "--rows", "R001, F1 , 0.5 ,1"])
+    rows_file = tmp_path / "rows.txt"
+    rows_file.write_text("R001, F2 , 1.5 , 2\n")
+    main(["plugin", "insert", *base, "--rows-file", str(rows_file)])
+    with PintsDB(db_path) as pdb:
+        assert pdb.fetch_df("SELECT * FROM demo_staging ORDER BY feature_id").values.tolist() == [
+            ["R001", "F1", 0.5, 1], ["R001", "F2", 1.5, 2]
+        ]
+
+    for content in ("R001,F3\n", "R001,F3,high,1\n"):
+        rows_file.write_text(content)
+        with pytest.raises(SystemExit, match="Cannot load"):
+            main(["plugin", "insert", *base, "--rows-file", str(rows_file)])
+
+
+def test_plugin_insert_quotes_manifest_identifiers(db_path, plugin_root, tmp_path):
+    manifest = plugin_root / "demo" / "manifest.yaml"
+    manifest.write_text(
+        manifest.read_text().replace("table: demo_staging", 'table: "demo staging"').replace("name: n,", "name: order,")
+    )
+    base = ["--db", str(db_path), "--name", "demo", "--root", str(plugin_root)]
+    main(["plugin", "insert", *base, "--rows", "R001,F1,0.5,1"])
+    rows_file = tmp_path / "rows.txt"
+    rows_file.write_text("R001,F2,1.5,2\n")
+    main(["plugin", "insert", *base, "--rows-file", str(rows_file)])
+    with PintsDB(db_path) as pdb:
+        assert pdb.fetch_df('SELECT feature_id, "order" FROM "demo staging" ORDER BY 1').values.tolist() == [
+            ["F1", 1], ["F2", 2]
+        ]
+
+
+def test_plugin_insert_reports_unconvertible_values(db_path, plugin_root):
+    base = ["--db", str(db_path), "--name", "demo", "--root", str(plugin_root)]
+    main(["plugin", "insert", *base, "--rows", "R001,F1,0.5,1.0"])
+    with pytest.raises(SystemExit, match="Cannot convert row to staging column types"):
+        main(["plugin", "insert", *base, "--rows", "R001,F2,0.5,1", "R001,F3,high,1"])
+    with PintsDB(db_path) as pdb:
+        assert pdb.fetch_df("SELECT feature_id FROM demo_staging").values.tolist() == [["F1"]]
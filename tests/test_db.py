@@ -0,0 +1,227 @@
+# tests/test_db.py
+import pytest
+
+from pints.db import PintsDB
+
+
+def test_add_run_same_sample_updates_in_place(db: PintsDB):
+    # R001 is seeded for S001 and referenced by features
+    db.add_run("R001", "S001", instrument="Orbitrap")
+    assert db.fetch_df("SELECT sample_id, instrument FROM runs WHERE run_id = 'R001'").values.tolist() == [
+        ["S001", "Orbitrap"]
+    ]
+
+
+def test_add_run_changed_sample_raises(db: PintsDB):
+    db.add_sample("S002", "Sample")
+    with pytest.raises(ValueError, match="R001"):
+        db.add_run("R001", "S002", instrument="Orbitrap")
+    assert db.fetch_df("SELECT sample_id, instrument FROM runs WHERE run_id = 'R001'").values.tolist() == [
+        ["S001", "QTOF-XYZ"]
+    ]
+
+
+def test_unreferenced_run_moves_to_new_sample(db: PintsDB, tmp_path):
+    import pandas as pd
+
+    db.add_sample("S002", "Sample")
+    db.add_run("R_FREE", "S001")
+    db.add_run("R_FREE", "S002", instrument="Orbitrap")
+    assert db.fetch_df("SELECT sample_id, instrument FROM runs WHERE run_id = 'R_FREE'").values.tolist() == [
+        ["S002", "Orbitrap"]
+    ]
+    runs = pd.DataFrame({"run_id": ["R_FREE"], "sample_id": ["S001"], "acq_time_utc": [None],
+                         "instrument": ["X"], "method_id": [None], "batch_id": [None]})
+    db.add_runs_bulk(runs)
+    assert db.fetch_df("SELECT sample_id FROM runs WHERE run_id = 'R_FREE'").values.tolist() == [["S001"]]
+    csv_path = tmp_path / "runs.csv"
+    runs.assign(sample_id=["S002"]).to_csv(csv_path, index=False)
+    db.import_runs_csv(csv_path)
+    assert db.fetch_df("SELECT sample_id FROM runs WHERE run_id = 'R_FREE'").values.tolist() == [["S002"]]
+
+
+def test_bulk_and_csv_runs_reject_changed_sample(db: PintsDB, tmp_path):
+    import pandas as pd
+
+    db.add_sample("S002", "Sample")
+    runs = pd.DataFrame({"run_id": ["R001"], "sample_id": ["S002"], "acq_time_utc": [None],
+                         "instrument": ["X"], "method_id": [None], "batch_id": [None]})
+    with pytest.raises(ValueError):
+        db.add_runs_bulk(runs)
+    csv_path = tmp_path / "runs.csv"
+    runs.to_csv(csv_path, index=False)
+    with pytest.raises(ValueError):
+        db.import_runs_csv(csv_path)
+
+    db.begin_batch()
+    db.add_run("R001", "S002")
+    with pytest.raises(ValueError):
+        db.end_batch()
+    assert db.fetch_df("SELECT sample_id FROM runs WHERE run_id = 'R001'").values.tolist() == [["S001"]]
+
+
+def test_add_features_arrays_stores_missing_as_null(db: PintsDB):
+    import numpy as np
+
+    n = db.add_features_arrays(["A1", "A2"], ["R001", "R001"], ["S001", "S001"],
+                               np.array([100.5, 200.5]), [None, 12.5], np.array([np.nan, 3.0]))
+    assert n == 2
+    rows = db.fetch_df(
+        "SELECT feature_id, rt IS NULL AS rt_null, area IS NULL AS area_null, mz "
+        "FROM features WHERE feature_id IN ('A1', 'A2') ORDER BY feature_id"
+    ).values.tolist()
+    assert rows == [["A1", True, True, 100.5], ["A2", False, False, 200.5]]
+    with pytest.raises(ValueError):
+        db.add_features_arrays(["A3"], ["R001"], ["S001"], [1.0, 2.0], [1.0], [1.0])
+
+
+def test_transaction_rolls_back_pintsdb_calls(db: PintsDB):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.add_sample("S_TX", "Sample")
+            raise RuntimeError("abort")
+    assert db.fetch_df("SELECT * FROM samples WHERE sample_id = 'S_TX'").empty
+
+
+def test_transaction_nests_bulk_and_batch_calls(db: PintsDB, tmp_path):
+    import pandas as pd
+
+    csv_path = tmp_path / "samples.csv"
+    csv_path.write_text("sample_id,sample_type,description\nS_CSV,Sample,x\n")
+    with db.transaction():
+        db.bootstrap()
+        db.add_samples_bulk(pd.DataFrame({"sample_id": ["S_BULK"], "sample_type": ["Blank"],
+                                          "description": [None]}))
+        db.import_samples_csv(csv_path)
+        db.begin_batch()
+        db.add_sample("S_BATCH")
+        db.end_batch()
+    assert db.fetch_df(
+        "SELECT sample_id FROM samples WHERE sample_id IN ('S_BULK', 'S_CSV', 'S_BATCH') ORDER BY 1"
+    )["sample_id"].tolist() == ["S_BATCH", "S_BULK", "S_CSV"]
+
+
+def test_duplicate_keys_keep_last_row_on_every_upsert_path(db: PintsDB, tmp_path):
+    import pandas as pd
+
+    frame = pd.DataFrame({"feature_id": ["D1", "D1"], "run_id": ["R001", "R001"],
+                          "sample_id": ["S001", "S001"], "mz": [5.0, 6.0],
+                          "rt": [1.0, 1.0], "area": [1.0, 1.0]})
+    db.add_features_bulk(frame)
+    assert db.get_feature("D1")["mz"] == 6.0
+
+    csv_path = tmp_path / "features.csv"
+    frame.assign(mz=[7.0, 8.0]).to_csv(csv_path, index=False)
+    db.import_features_csv(csv_path)
+    assert db.get_feature("D1")["mz"] == 8.0
+
+    db.begin_batch()
+    db.add_feature("D1", "R001", "S001", mz=9.0)
+    db.add_feature("D1", "R001", "S001", mz=10.0)
+    db.end_batch()
+    assert db.get_feature("D1")["mz"] == 10.0
+
+
+# ---------------- batching ----------------
+
+def test_batch_buffers_until_flush_in_foreign_key_order(db: PintsDB):
+    db.begin_batch()
+    # children before parents: flush() writes samples, runs, features in that order
+    db.add_feature("B_F1", "B_R1", "B_S1", mz=100.0)
+    db.add_run("B_R1", "B_S1")
+    db.add_sample("B_S1", "Sample")
+    assert db.get_feature("B_F1") is None
+    db.flush()
+    assert db.get_feature("B_F1")["run_id"] == "B_R1"
+    db.end_batch()
+    db.add_sample("B_S2")  # row-at-a-time again
+    assert not db.fetch_df("SELECT * FROM samples WHERE sample_id = 'B_S2'").empty
+
+
+def test_batch_auto_flushes(db: PintsDB, monkeypatch):
+    import pints.db
+
+    monkeypatch.setattr(pints.db, "_BATCH_FLUSH_ROWS", 3)
+    db.begin_batch()
+    for i in range(3):
+        db.add_sample(f"AF{i}")
+    assert db.fetch_df("SELECT count(*) AS n FROM samples WHERE sample_id LIKE 'AF%'")["n"][0] == 3
+    db.end_batch()
+
+
+def test_batch_dropped_when_context_exits_with_error(db_path):
+    with pytest.raises(RuntimeError):
+        with PintsDB(db_path) as pdb:
+            pdb.begin_batch()
+            pdb.add_sample("DROPPED")
+            raise RuntimeError("abort")
+    with PintsDB(db_path) as pdb:
+        assert pdb.fetch_df("SELECT * FROM samples WHERE sample_id = 'DROPPED'").empty
+
+
+# ---------------- bulk upserts & CSV import ----------------
+
+def test_bulk_upserts_accept_pandas_and_arrow(db: PintsDB):
+    import pandas as pd
+    import pyarrow as pa
+
+    assert db.add_samples_bulk(pd.DataFrame({"sample_id": ["S001", "S_NEW"],
+                                             "sample_type": ["QC", "Blank"],
+                                             "description": [None, "new"]})) == 2
+    assert db.fetch_df("SELECT sample_type FROM samples WHERE sample_id = 'S001'")["sample_type"][0] == "QC"
+    features = pa.table({"feature_id": ["AR1"], "run_id": ["R001"], "sample_id": ["S001"],
+                         "mz": [123.4], "rt": [None], "area": [5.0]})
+    assert db.add_features_bulk(features) == 1
+    assert db.get_feature("AR1")["mz"] == 123.4
+
+
+def test_import_features_csv_ignores_extra_columns(db: PintsDB, tmp_path):
+    csv_path = tmp_path / "features.csv"
+    csv_path.write_text("extra,feature_id,run_id,sample_id,mz,rt,area\n"
+                        "x,CSV1,R001,S001,150.5,,10\n"
+                        "y,F0001,R001,S001,1.0,2.0,3.0\n")
+    assert db.import_features_csv(csv_path) == 2
+    assert db.get_feature("CSV1")["rt"] is None
+    assert db.get_feature("F0001")["mz"] == 1.0
+
+
+# ---------------- exports & identifier validation ----------------
+
+def test_parquet_and_arrow_exports_round_trip(db: PintsDB, tmp_path):
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    db.export_parquet("features", tmp_path / "features.parquet")
+    assert pq.read_table(tmp_path / "features.parquet").num_rows == 3
+    db.export_sql_parquet("SELECT feature_id FROM features WHERE mz > ?", tmp_path / "big.parquet", params=[300])
+    assert sorted(pq.read_table(tmp_path / "big.parquet")["feature_id"].to_pylist()) == ["F0001", "F0002"]
+    db.export_arrow("SELECT * FROM samples", tmp_path / "samples.arrow")
+    assert feather.read_table(tmp_path / "samples.arrow")["sample_id"].to_pylist() == ["S001"]
+
+
+def test_export_paths_with_quotes_are_bound(db: PintsDB, tmp_path):
+    out = tmp_path / "it's here.csv"
+    db.export_table("samples", out)
+    assert out.read_text().splitlines()[0] == "sample_id,sample_type,description"
+    out2 = tmp_path / "o'q.csv"
+    db.export_sql("SELECT sample_id FROM samples WHERE sample_id = ?", out2, params=["S001"])
+    assert out2.read_text().splitlines() == ["sample_id", "S001"]
+
+
+@pytest.mark.parametrize("name", ["nope", "samples; DROP TABLE runs", 'samples"'])
+def test_unknown_relations_are_rejected(db: PintsDB, tmp_path, name):
+    with pytest.raises(ValueError, match="Unknown table or view"):
+        db.export_table(name, tmp_path / "x.csv")
+    with pytest.raises(ValueError):
+        db.get_table_df(name)
+    assert not db.get_table_df("main.runs").empty
+    assert not db.get_table_df("V_FIELD_SEMANTICS").empty
+
+
+def test_set_algo_property_after_rolled_back_transaction(db: PintsDB):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.set_algo_property("feature", "F0001", "dqs", 0.5)
+            raise RuntimeError("abort")
+    db.set_algo_property("feature", "F0001", "dqs", 0.8)
+    assert db.get_algo_properties("feature", "F0001")["prop_value"].tolist() == [0.8]
@@ -0,0 +1,83 @@
+# tests/test_plugins.py
+import os
+
+from pints.db import PintsDB
+
+
+def _touch_later(path, seconds=10):
+    # make sure the mtime differs even on coarse-grained filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def _install_with_rows(db: PintsDB, root) -> None:
+    db.plugin_install("demo", root=root)
+    db.plugin_staging_create("demo", root=root)
+    db.run_sql("INSERT INTO demo_staging VALUES ('R001', 'F1', 0.5, 1), ('R001', 'F2', 1.5, 2)")
+    db.plugin_action_run("demo", "materialize", root=root)
+
+
+def test_action_uses_defaults_and_params(db: PintsDB, plugin_root):
+    _install_with_rows(db, plugin_root)
+    assert db.plugin_action_run("demo", "top", root=plugin_root)["feature_id"].tolist() == ["F1", "F2"]
+    assert db.plugin_action_run("demo", "top", {"min_score": 1}, root=plugin_root)["feature_id"].tolist() == ["F2"]
+
+
+def test_action_picks_up_edited_sql_and_manifest(db: PintsDB, plugin_root):
+    _install_with_rows(db, plugin_root)
+    plugdir = plugin_root / "demo"
+    assert len(db.plugin_action_run("demo", "top", root=plugin_root)) == 2
+
+    top_sql = plugdir / "top.sql"
+    top_sql.write_text("SELECT * FROM demo_final WHERE score > ? ORDER BY feature_id")
+    _touch_later(top_sql)
+    assert db.plugin_action_run("demo", "top", {"min_score": 0.5}, root=plugin_root)["feature_id"].tolist() == ["F2"]
+
+    manifest = plugdir / "manifest.yaml"
+    manifest.write_text(manifest.read_text().replace("default: 0.0", "default: 1.0"))
+    _touch_later(manifest)
+    assert db.plugin_action_run("demo", "top", root=plugin_root)["feature_id"].tolist() == ["F2"]
+
+
+def test_staging_loads_csv_lists_and_globs(db: PintsDB, plugin_root, tmp_path):
+    db.plugin_install("demo", root=plugin_root)
+    header = "run_id,feature_id,score,n\n"
+    (tmp_path / "a.csv").write_text(header + "R001,F1,0.5,1\n")
+    (tmp_path / "b.csv").write_text(header + "R001,F2,1.5,2\nR001,F3,2.5,3\n")
+    assert db.plugin_staging_load_csv("demo", tmp_path / "a.csv", root=plugin_root) == 1
+    assert db.plugin_staging_load_csvs("demo", [tmp_path / "a.csv", tmp_path / "b.csv"], root=plugin_root) == 3
+    assert db.plugin_staging_load_csvs("demo", str(tmp_path / "*.csv"), root=plugin_root) == 3
+    assert db.fetch_df("SELECT count(*) AS n FROM demo_staging")["n"][0] == 7
+    db.plugin_staging_clear("demo", root=plugin_root)
+    assert db.fetch_df("SELECT count(*) AS n FROM demo_staging")["n"][0] == 0
+
+
+def test_staging_load_csv_uses_manifest_options_and_counts_rows(db: PintsDB, plugin_root, tmp_path):
+    manifest = plugin_root / "demo" / "manifest.yaml"
+    manifest.write_text(manifest.read_text().replace('{header: true, delimiter: ","}', '{header: false, delimiter: ";"}'))
+    assert db.plugin_staging_load_csvs("demo", [], root=plugin_root) == 0
+    assert db.fetch_df("SELECT count(*) AS n FROM demo_staging")["n"][0] == 0
+
+    (tmp_path / "a.csv").write_text("R001;F1;0.5;1\nR001;F2;1.5;2\n")
+    assert db.plugin_staging_load_csv("demo", tmp_path / "a.csv", root=plugin_root) == 2
+    assert db.plugin_staging_load_csvs("demo", [str(tmp_path / "a.csv")], root=plugin_root) == 2
+    assert db.fetch_df("SELECT feature_id, score, n FROM demo_staging ORDER BY 1, 2").values.tolist() == [
+        ["F1", 0.5, 1], ["F1", 0.5, 1], ["F2", 1.5, 2], ["F2", 1.5, 2]
+    ]
+
+
+def test_action_run_many(db: PintsDB, plugin_root):
+    db.plugin_install("demo", root=plugin_root)
+    (plugin_root / "demo" / "add.sql").write_text("INSERT INTO demo_final VALUES (?, ?, ?, ?)")
+    manifest = plugin_root / "demo" / "manifest.yaml"
+    manifest.write_text(manifest.read_text() + (
+        "  - name: add\n    file: add.sql\n    params:\n"
+        "      - {name: run_id}\n      - {name: feature_id}\n"
+        "      - {name: score, default: 0.0}\n      - {name: n, default: 1}\n"))
+    _touch_later(manifest)
+    db.plugin_action_run_many("demo", "add", [{"run_id": "R001", "feature_id": "M1"},
+                                               {"run_id": "R001", "feature_id": "M2", "score": 2.0}],
+                              root=plugin_root)
+    assert db.fetch_df("SELECT feature_id, score, n FROM demo_final ORDER BY 1").values.tolist() == [
+        ["M1", 0.0, 1], ["M2", 2.0, 1]
+    ]
@@ -3,24 +3,22 @@ import duckdb
 import pytest
 from pathlib import Path
 
-from pints import PintsDB, get_sql_path
+from pints import get_sql_path
+from pints.db import PintsDB
 
 
 def test_sql_files_packaged():
     # Ensure vendored SQL files are available in the installed package
-    core = Path(get_sql_path("pints_core_v1.sql"))
-    seed = Path(get_sql_path("pints_core_seed_v1.sql"))
+    core = Path(get_sql_path("core/pints_core_v1.sql"))
+    seed = Path(get_sql_path("seeds/pints_core_seed_v1.sql"))
     assert core.exists() and core.stat().st_size > 0
     assert seed.exists() and seed.stat().st_size > 0
 
 
-def test_init_seed_and_basic_queries(tmp_path: Path):
-    db_path = tmp_path / "pints_test.duckdb"
-    db = PintsDB(db_path)
-
-    # 1) init + seed should run without errors
+def test_init_seed_and_basic_queries(db: PintsDB, db_path: Path):
+    # 1) init + seed ran in the session fixture (conftest.py); re-running
+    #    the schema script must still be a no-op
     db.init_schema()
-    db.seed_minimal_vocab()
 
     # 2) tables should exist
     con = duckdb.connect(str(db_path))
@@ -50,7 +48,7 @@ def test_init_seed_and_basic_queries(tmp_path: Path):
     # 4) insert minimal sample/run/feature via API
     db.add_sample("S001", "Sample", "Smoke test sample")
     db.add_run("R001", "S001", "2025-09-12 09:00:00", "QTOF-XYZ", "POS_5min", "B01")
-    db.add_feature("R001_F0001", "R001", mz=301.123456, rt=312.4, area=154321.2)
+    db.add_feature("R001_F0001", "R001", "S001", mz=301.123456, rt=312.4, area=154321.2)
 
     # 5) verify inserts
     n_samples = con.execute("SELECT COUNT(*) FROM samples").fetchone()[0]